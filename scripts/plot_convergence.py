@@ -16,37 +16,80 @@
     - convergence_comparison_M100.png  # 所有算法对比图
     - convergence_individual_CBO_M100.png  # 单个算法详细图
     - convergence_individual_ICBO-Enhanced_M100.png
+    - cache/convergence_[算法]_[规模].parquet  # CSV解析缓存（CSV更新后自动重建）
 
 依赖：
-    pip install matplotlib pandas numpy
+    pip install matplotlib numpy polars
 """
 
 import os
+import re
 import glob
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 import numpy as np
+import polars as pl
+import matplotlib
+matplotlib.use('Agg')  # 仅输出PNG，跳过GUI后端探测
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 from pathlib import Path
 
 # 配置matplotlib中文显示
 plt.rcParams['font.sans-serif'] = ['SimHei', 'DejaVu Sans']  # 中文字体
 plt.rcParams['axes.unicode_minus'] = False  # 解决负号显示问题
 
+# 启用Agg的折线简化快速路径（收敛曲线点数较多）
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
+
+# 收敛曲线文件名：convergence_[算法]_[规模]_seed[种子].csv
+CONVERGENCE_FILE_RE = re.compile(
+    r'convergence_(?P<alg>[^_]+)_(?P<scale>M\d+)_seed(?P<seed>\d+)\.csv')
+
+
+# Parquet缓存的固定列布局
+CACHE_SCHEMA = {'Seed': pl.Int32, 'Iteration': pl.Int32, 'BestFitness': pl.Float64}
+
+
+class ConvergenceData:
+    """单个算法/规模下所有种子的收敛数据（按列分开存储的连续数组）"""
+
+    def __init__(self, seeds, iterations, fitness):
+        """
+        Args:
+            seeds: 种子数组，int32，形状(N_seeds,)
+            iterations: 迭代序号数组，int32，形状(N_iter,)
+            fitness: 适应度矩阵fitness[seed, iter]，float32，形状(N_seeds, N_iter)；
+                     某种子缺少的迭代以NaN填充
+        """
+        self.seeds = seeds
+        self.iterations = iterations
+        self.fitness = fitness
+
+    def segments(self):
+        """每个种子一条折线的顶点数组，形状(N_seeds, N_iter, 2)，供LineCollection使用"""
+        x = np.broadcast_to(self.iterations, self.fitness.shape)
+        return np.stack([x, self.fitness], axis=-1)
+
 
 class ConvergencePlotter:
     """收敛曲线绘图器"""
 
-    def __init__(self, data_dir=".", output_dir="results"):
+    def __init__(self, data_dir=".", output_dir="results", cache_dir=None):
         """
         初始化绘图器
 
         Args:
             data_dir: CSV文件所在目录
             output_dir: 输出图片目录
+            cache_dir: Parquet缓存目录（默认为data_dir/cache）
         """
         self.data_dir = Path(data_dir)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else self.data_dir / "cache"
 
         # 算法配色方案（区分度高的颜色）
         self.colors = {
@@ -68,6 +111,38 @@ class ConvergencePlotter:
             'PSO': '-',
         }
 
+        # 文件索引：(algorithm, scale) -> [(seed, path), ...]，只扫描一次目录
+        self._index = self._build_index()
+
+        # 收敛数据缓存：(algorithm, scale) -> ConvergenceData，避免重复读取CSV
+        self._cache = {}
+
+        # 统计量缓存：(algorithm, scale) -> (mean, std, ConvergenceData)
+        self._stats = {}
+
+        # 单算法图复用同一Figure/Axes，避免每次重新创建
+        self._single_fig = None
+        self._single_ax = None
+
+    def _build_index(self):
+        """
+        扫描数据目录，按(算法, 规模)索引所有收敛曲线文件
+
+        Returns:
+            dict: (algorithm, scale) -> 按种子排序的[(seed, path), ...]
+        """
+        index = {}
+        with os.scandir(self.data_dir) as it:
+            for entry in it:
+                match = CONVERGENCE_FILE_RE.fullmatch(entry.name)
+                if match and entry.is_file():
+                    key = (match['alg'], match['scale'])
+                    index.setdefault(key, []).append((int(match['seed']), Path(entry.path)))
+
+        for files in index.values():
+            files.sort()
+        return index
+
     def load_convergence_data(self, algorithm, scale):
         """
         加载指定算法和规模的所有种子收敛数据
@@ -77,26 +152,168 @@ class ConvergencePlotter:
             scale: 规模（如"M100"）
 
         Returns:
-            DataFrame包含列：Iteration, BestFitness, Seed
+            ConvergenceData，未找到文件时返回None
         """
-        pattern = f"convergence_{algorithm}_{scale}_seed*.csv"
-        files = list(self.data_dir.glob(pattern))
+        key = (algorithm, scale)
+        if key in self._cache:
+            return self._cache[key]
+
+        files = self._index.get(key)
 
         if not files:
-            print(f"⚠️  未找到文件: {pattern}")
+            print(f"⚠️  未找到文件: convergence_{algorithm}_{scale}_seed*.csv")
+            self._cache[key] = None
             return None
 
-        all_data = []
-        for file in files:
-            # 从文件名提取种子
-            seed = int(file.stem.split('seed')[-1])
-            df = pd.read_csv(file)
-            df['Seed'] = seed
-            all_data.append(df)
+        df = pl.read_parquet(self._ensure_parquet_cache(algorithm, scale, files))
+        data = self._to_convergence_data(df)
+        print(f"✓ 加载 {algorithm}-{scale}: {len(files)} seeds, {len(df)} 数据点")
+        self._cache[key] = data
+        return data
+
+    @staticmethod
+    def _to_convergence_data(df):
+        """
+        将长表转换为ConvergenceData，各列直接转为紧凑类型的数组
+
+        各种子的迭代数可以不同（如某次实验提前中断）：迭代轴取所有种子迭代序号的并集，
+        缺失位置填NaN，不会把不同种子的数据错位拼接。
+
+        Args:
+            df: DataFrame(Polars)，列：Seed, Iteration, BestFitness
+
+        Returns:
+            ConvergenceData
+        """
+        seeds, row = np.unique(df['Seed'].cast(pl.Int32).to_numpy(), return_inverse=True)
+        iterations, col = np.unique(df['Iteration'].cast(pl.Int32).to_numpy(), return_inverse=True)
+        fitness = np.full((len(seeds), len(iterations)), np.nan, dtype=np.float32)
+        fitness[row, col] = df['BestFitness'].cast(pl.Float32).to_numpy()
+        return ConvergenceData(seeds, iterations, fitness)
+
+    def load_scale(self, algorithms, scale):
+        """
+        用一次查询加载同一规模下多个算法的数据并计算统计量，结果写入缓存
+
+        所有算法的Parquet缓存在一次扫描中读取，算法名取自文件名，
+        均值/标准差由一次group_by(['algorithm', 'Iteration'])得到。
 
-        combined = pd.concat(all_data, ignore_index=True)
-        print(f"✓ 加载 {algorithm}-{scale}: {len(files)} seeds, {len(combined)} 数据点")
-        return combined
+        Args:
+            algorithms: 算法列表
+            scale: 规模
+        """
+        cache_files = []
+        for algorithm in algorithms:
+            key = (algorithm, scale)
+            if key in self._stats:
+                continue
+            files = self._index.get(key)
+            if not files:
+                print(f"⚠️  未找到文件: convergence_{algorithm}_{scale}_seed*.csv")
+                self._cache[key] = None
+                self._stats[key] = None
+                continue
+            cache_files.append(self._ensure_parquet_cache(algorithm, scale, files))
+
+        if not cache_files:
+            return
+
+        raw = (pl.scan_parquet(cache_files, include_file_paths='src')
+                 .with_columns(pl.col('src')
+                                 .str.extract(r'convergence_([^_/\\]+)_M\d+\.parquet$', 1)
+                                 .alias('algorithm'))
+                 .drop('src'))
+        summary = (raw.group_by('algorithm', 'Iteration')
+                      .agg(pl.col('BestFitness').mean().alias('mean'),
+                           pl.col('BestFitness').std().alias('std'))
+                      .sort('algorithm', 'Iteration'))
+        raw, summary = pl.collect_all([raw, summary])
+
+        raw_parts = raw.partition_by('algorithm', as_dict=True)
+        for (algorithm,), part in summary.partition_by('algorithm', as_dict=True).items():
+            part_raw = raw_parts[(algorithm,)]
+            data = self._to_convergence_data(part_raw)
+            print(f"✓ 加载 {algorithm}-{scale}: {len(data.seeds)} seeds, {len(part_raw)} 数据点")
+            self._cache[(algorithm, scale)] = data
+            self._stats[(algorithm, scale)] = (part['mean'].to_numpy(), part['std'].to_numpy(), data)
+
+        # 缓存中没有数据行的算法（如所有种子都只有表头）不会出现在分组结果中，同样记为无数据
+        for algorithm in algorithms:
+            self._stats.setdefault((algorithm, scale), None)
+
+    def get_statistics(self, algorithm, scale):
+        """
+        获取（并缓存）指定算法和规模的逐迭代统计量
+
+        统计量统一由load_scale计算，单独调用时与main中批量加载的结果一致。
+
+        Args:
+            algorithm: 算法名称
+            scale: 规模
+
+        Returns:
+            (mean, std, data)：逐迭代均值、标准差（ddof=1）和原始ConvergenceData，
+            未找到数据时返回None
+        """
+        key = (algorithm, scale)
+        if key not in self._stats:
+            self.load_scale([algorithm], scale)
+        return self._stats.get(key)
+
+    def _ensure_parquet_cache(self, algorithm, scale, files):
+        """
+        确保(算法, 规模)的Parquet缓存有效，否则由CSV重建
+
+        缓存有效需同时满足：不早于任何CSV、列布局等于CACHE_SCHEMA、
+        写入时记录的种子列表与文件索引一致。
+
+        Args:
+            algorithm: 算法名称
+            scale: 规模
+            files: 文件索引中的[(seed, path), ...]
+
+        Returns:
+            Parquet缓存文件路径
+        """
+        cache_file = self.cache_dir / f"convergence_{algorithm}_{scale}.parquet"
+        # 种子列表随缓存写入Parquet元数据：仅比较mtime无法发现删除的种子文件
+        # 或保留旧mtime新增的文件（cp -p / rsync / 解压）；只有表头的种子没有数据行，
+        # 也无法从Seed列中核对
+        seeds = ','.join(str(seed) for seed, _ in files)
+        newest_csv = max(path.stat().st_mtime for _, path in files)
+        if (cache_file.exists() and cache_file.stat().st_mtime >= newest_csv
+                and pl.read_parquet_schema(cache_file) == CACHE_SCHEMA
+                and pl.read_parquet_metadata(cache_file).get('seeds') == seeds):
+            return cache_file
+
+        # 惰性扫描各种子文件，只投影所需列，由流式引擎并行解析并直接写出Parquet
+        lazy = pl.concat([self._scan_one(item) for item in files]).cast(CACHE_SCHEMA)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix('.parquet.tmp')
+        lazy.sink_parquet(tmp_file, metadata={'seeds': seeds})
+        os.replace(tmp_file, cache_file)
+        return cache_file
+
+    @staticmethod
+    def _scan_one(item):
+        """
+        惰性扫描单个种子的收敛CSV
+
+        列类型显式声明而不是由内容推断：未记录任何迭代的运行只写出表头，
+        推断会得到String列，导致与其他种子拼接失败。
+
+        Args:
+            item: 文件索引中的(seed, path)
+
+        Returns:
+            LazyFrame(Polars)，列：Seed, Iteration, BestFitness
+        """
+        seed, file = item
+        dtypes = {name: CACHE_SCHEMA[name] for name in ('Iteration', 'BestFitness')}
+        return (pl.scan_csv(file, schema_overrides=dtypes)
+                  .select(pl.lit(seed, dtype=CACHE_SCHEMA['Seed']).alias('Seed'),
+                          'Iteration', 'BestFitness'))
 
     def plot_single_algorithm(self, algorithm, scale):
         """
@@ -106,34 +323,38 @@ class ConvergencePlotter:
             algorithm: 算法名称
             scale: 规模
         """
-        data = self.load_convergence_data(algorithm, scale)
-        if data is None:
+        stats = self.get_statistics(algorithm, scale)
+        if stats is None:
             return
+        mean_data, std_data, data = stats
 
-        fig, ax = plt.subplots(figsize=(10, 6))
+        color = self.colors.get(algorithm, '#000000')
 
-        # 绘制每个种子的曲线（半透明）
-        for seed in data['Seed'].unique():
-            seed_data = data[data['Seed'] == seed]
-            ax.plot(seed_data['Iteration'], seed_data['BestFitness'],
-                   alpha=0.3, linewidth=1, color=self.colors.get(algorithm, '#000000'))
+        if self._single_fig is None:
+            self._single_fig, self._single_ax = plt.subplots(figsize=(10, 6))
+        fig, ax = self._single_fig, self._single_ax
+        ax.clear()
 
-        # 计算并绘制均值曲线（加粗）
-        mean_data = data.groupby('Iteration')['BestFitness'].mean()
-        std_data = data.groupby('Iteration')['BestFitness'].std()
+        # 绘制每个种子的曲线（半透明），所有种子合并为一个LineCollection
+        ax.add_collection(LineCollection(data.segments(), colors=color, alpha=0.3, linewidths=1,
+                                         rasterized=True))
+        ax.autoscale_view()
 
-        ax.plot(mean_data.index, mean_data.values,
+        # 绘制均值曲线（加粗）
+        x = data.iterations
+        ax.plot(x, mean_data,
                label=f'{algorithm} Mean',
                linewidth=2.5,
-               color=self.colors.get(algorithm, '#000000'))
+               color=color)
 
         # 添加置信区间阴影（±1 std）
-        ax.fill_between(mean_data.index,
+        ax.fill_between(x,
                         mean_data - std_data,
                         mean_data + std_data,
                         alpha=0.2,
-                        color=self.colors.get(algorithm, '#000000'),
-                        label='±1 Std')
+                        color=color,
+                        label='±1 Std',
+                        rasterized=True)
 
         # 图表美化
         ax.set_xlabel('Iteration', fontsize=12)
@@ -144,9 +365,8 @@ class ConvergencePlotter:
 
         # 保存图片
         output_file = self.output_dir / f"convergence_individual_{algorithm}_{scale}.png"
-        plt.tight_layout()
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.subplots_adjust(left=0.09, right=0.98, top=0.93, bottom=0.10)
+        fig.savefig(output_file, dpi=300, pil_kwargs={'compress_level': 1})
 
         print(f"✓ 生成单算法图: {output_file}")
 
@@ -158,30 +378,34 @@ class ConvergencePlotter:
             algorithms: 算法列表（如["CBO", "ICBO-Enhanced"]）
             scale: 规模
         """
+        self.load_scale(algorithms, scale)
+
         fig, ax = plt.subplots(figsize=(12, 7))
 
         for algorithm in algorithms:
-            data = self.load_convergence_data(algorithm, scale)
-            if data is None:
+            stats = self.get_statistics(algorithm, scale)
+            if stats is None:
                 continue
+            mean_data, std_data, data = stats
+            x = data.iterations
 
-            # 计算均值和标准差
-            mean_data = data.groupby('Iteration')['BestFitness'].mean()
-            std_data = data.groupby('Iteration')['BestFitness'].std()
+            color = self.colors.get(algorithm, '#000000')
+            ls = self.linestyles.get(algorithm, '-')
 
             # 绘制均值曲线
-            ax.plot(mean_data.index, mean_data.values,
+            ax.plot(x, mean_data,
                    label=algorithm,
                    linewidth=2.5,
-                   linestyle=self.linestyles.get(algorithm, '-'),
-                   color=self.colors.get(algorithm, '#000000'))
+                   linestyle=ls,
+                   color=color)
 
             # 添加置信区间阴影
-            ax.fill_between(mean_data.index,
+            ax.fill_between(x,
                             mean_data - std_data,
                             mean_data + std_data,
                             alpha=0.15,
-                            color=self.colors.get(algorithm, '#000000'))
+                            color=color,
+                            rasterized=True)
 
         # 图表美化
         ax.set_xlabel('Iteration', fontsize=14, fontweight='bold')
@@ -193,8 +417,8 @@ class ConvergencePlotter:
 
         # 保存图片
         output_file = self.output_dir / f"convergence_comparison_{scale}.png"
-        plt.tight_layout()
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        plt.subplots_adjust(left=0.08, right=0.98, top=0.94, bottom=0.09)
+        plt.savefig(output_file, dpi=300, pil_kwargs={'compress_level': 1})
         plt.close()
 
         print(f"✓ 生成对比图: {output_file}")
@@ -209,26 +433,27 @@ class ConvergencePlotter:
         """
         report_lines = [
             f"# 收敛曲线分析报告 - {scale}\n",
-            f"生成时间: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
             "\n## 算法收敛性能对比\n",
             "| 算法 | 初始Makespan | 最终Makespan | 总改进率 | 收敛速度(50%) |\n",
             "|------|-------------|-------------|---------|---------------|\n"
         ]
 
+        self.load_scale(algorithms, scale)
         for algorithm in algorithms:
-            data = self.load_convergence_data(algorithm, scale)
-            if data is None:
+            stats = self.get_statistics(algorithm, scale)
+            if stats is None:
                 continue
 
             # 计算统计指标
-            mean_data = data.groupby('Iteration')['BestFitness'].mean()
-            initial = mean_data.iloc[0]
-            final = mean_data.iloc[-1]
+            mean_data = stats[0]
+            initial = mean_data[0]
+            final = mean_data[-1]
             improvement = (initial - final) / initial * 100
 
             # 收敛速度：前50%迭代的改进比例
             half_point = len(mean_data) // 2
-            half_improvement = (initial - mean_data.iloc[half_point]) / (initial - final) * 100
+            half_improvement = (initial - mean_data[half_point]) / (initial - final) * 100
 
             report_lines.append(
                 f"| {algorithm} | {initial:.2f} | {final:.2f} | "
@@ -242,11 +467,34 @@ class ConvergencePlotter:
 
         # 保存报告
         report_file = self.output_dir / f"convergence_report_{scale}.md"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.writelines(report_lines)
+        report_file.write_text("".join(report_lines), encoding='utf-8')
 
         print(f"✓ 生成分析报告: {report_file}")
 
+    def close(self):
+        """释放复用的单算法Figure"""
+        if self._single_fig is not None:
+            plt.close(self._single_fig)
+            self._single_fig = None
+            self._single_ax = None
+
+
+# 子进程内的绘图器（每个进程创建一次，跨任务复用Figure）
+_worker_plotter = None
+
+
+def _init_worker(data_dir, output_dir, cache_dir):
+    """子进程初始化：创建进程内共享的绘图器"""
+    global _worker_plotter
+    _worker_plotter = ConvergencePlotter(data_dir=data_dir, output_dir=output_dir,
+                                         cache_dir=cache_dir)
+
+
+def _plot_single_worker(algorithm, scale, stats):
+    """子进程入口：使用主进程预先计算的统计量绘制单个算法的收敛曲线"""
+    _worker_plotter._stats[(algorithm, scale)] = stats
+    _worker_plotter.plot_single_algorithm(algorithm, scale)
+
 
 def main():
     """主函数"""
@@ -264,10 +512,22 @@ def main():
     print(f"目标规模: {scale}")
     print(f"对比算法: {', '.join(algorithms)}\n")
 
-    # 1. 绘制每个算法的单独图
-    print("步骤1: 生成单算法收敛曲线...")
-    for algorithm in algorithms:
-        plotter.plot_single_algorithm(algorithm, scale)
+    # 0. 每个(算法, 规模)只加载和统计一次，后续绘图和报告直接复用
+    print("步骤0: 加载收敛数据...")
+    plotter.load_scale(algorithms, scale)
+    all_stats = {algorithm: plotter.get_statistics(algorithm, scale)
+                 for algorithm in algorithms}
+
+    # 1. 绘制每个算法的单独图（图像渲染受GIL限制，按算法分进程并行）
+    print("\n步骤1: 生成单算法收敛曲线...")
+    with ProcessPoolExecutor(max_workers=min(len(algorithms), os.cpu_count() or 1),
+                             initializer=_init_worker,
+                             initargs=(plotter.data_dir, plotter.output_dir,
+                                       plotter.cache_dir)) as ex:
+        futures = [ex.submit(_plot_single_worker, algorithm, scale, stats)
+                   for algorithm, stats in all_stats.items() if stats is not None]
+        for future in futures:
+            future.result()
 
     # 2. 绘制算法对比图
     print("\n步骤2: 生成算法对比图...")
@@ -276,6 +536,7 @@ def main():
     # 3. 生成分析报告
     print("\n步骤3: 生成收敛分析报告...")
     plotter.generate_convergence_report(algorithms, scale)
+    plotter.close()
 
     print("\n" + "="*70)
     print("✅ 全部完成！".center(70))
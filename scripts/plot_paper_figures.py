@@ -11,10 +11,11 @@ Generates all publication-quality figures for the ICBO paper:
 4. Heterogeneity Impact Comparison
 """
 
+import matplotlib
+matplotlib.use('Agg')  # 仅输出PNG，跳过GUI后端探测
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import seaborn as sns
 from matplotlib.patches import Rectangle
 
 # 设置matplotlib参数
@@ -22,6 +23,11 @@ plt.rcParams['font.size'] = 12
 plt.rcParams['figure.dpi'] = 300
 plt.rcParams['axes.linewidth'] = 1.5
 
+# 启用Agg的折线简化快速路径
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
+
 # 颜色方案（色盲友好）
 COLORS = {
     'ICBO-Enhanced': '#2E86AB',  # 蓝色
@@ -46,7 +52,7 @@ def plot_ranking_comparison():
     hetero_ranks = [7.00, 4.86, 4.57, 4.29, 2.86, 1.71, 2.71]     # 异构参数
 
     # 创建图表
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6), sharey=True)
 
     y_pos = np.arange(len(algorithms))
 
@@ -60,8 +66,7 @@ def plot_ranking_comparison():
     ax1.grid(axis='x', alpha=0.3, linestyle='--')
 
     # 标注数值
-    for i, (bar, rank) in enumerate(zip(bars1, fixed_ranks)):
-        ax1.text(rank - 0.2, i, f'{rank:.2f}', va='center', ha='right', fontweight='bold')
+    ax1.bar_label(bars1, fmt='%.2f', padding=-11, fontweight='bold')
 
     # 突出显示ICBO-E排名第1
     ax1.patches[6].set_edgecolor('#FFD700')
@@ -69,23 +74,21 @@ def plot_ranking_comparison():
 
     # 异构参数（右图）
     bars2 = ax2.barh(y_pos, hetero_ranks, color=[COLORS.get(alg, '#666666') for alg in algorithms])
-    ax2.set_yticks(y_pos)
-    ax2.set_yticklabels(algorithms)
+    ax2.tick_params(labelleft=False)  # 与左图共享y轴，不重复显示算法名
     ax2.set_xlabel('Average Rank (Lower is Better)', fontweight='bold')
     ax2.set_title('Heterogeneous Parameters (7 Scales)', fontsize=14, fontweight='bold')
     ax2.grid(axis='x', alpha=0.3, linestyle='--')
 
     # 标注数值
-    for i, (bar, rank) in enumerate(zip(bars2, hetero_ranks)):
-        ax2.text(rank + 0.2, i, f'{rank:.2f}', va='center', ha='left', fontweight='bold')
+    ax2.bar_label(bars2, fmt='%.2f', padding=11, fontweight='bold')
 
     # 突出显示PSO排名第1
     ax2.patches[5].set_edgecolor('#FFD700')
     ax2.patches[5].set_linewidth(3)
 
-    plt.tight_layout()
+    plt.subplots_adjust(left=0.07, right=0.965, top=0.93, bottom=0.11, wspace=0.08)
     output_file = 'results/algorithm_ranking_comparison.png'
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    plt.savefig(output_file, dpi=300, pil_kwargs={'compress_level': 1})
     print(f"  Saved: {output_file}")
     plt.close()
 
@@ -115,11 +118,7 @@ def plot_m2000_bar_chart():
     bars[6].set_hatch('///')
 
     # 添加数值标签
-    for i, (bar, makespan) in enumerate(zip(bars, makespans)):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 100,
-                f'{makespan:.2f}',
-                ha='center', va='bottom', fontweight='bold', fontsize=11)
+    ax.bar_label(bars, fmt='%.2f', padding=6, fontweight='bold', fontsize=11)
 
     # 添加改进率标注（相对于PSO）
     pso_makespan = 3496.92
@@ -144,9 +143,9 @@ def plot_m2000_bar_chart():
     # 设置y轴范围
     ax.set_ylim(0, 6200)
 
-    plt.tight_layout()
+    plt.subplots_adjust(left=0.08, right=0.985, top=0.91, bottom=0.10)
     output_file = 'results/M2000_bar_chart.png'
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    plt.savefig(output_file, dpi=300, pil_kwargs={'compress_level': 1})
     print(f"  Saved: {output_file}")
     plt.close()
 
@@ -162,19 +161,17 @@ def plot_icbo_improvement_rate():
     scales = [50, 100, 200, 300, 500, 1000, 2000]
 
     # CBO Makespan
-    cbo_makespans = [691.28, 971.98, 1178.67, 1499.52, 2006.63, 2726.39, 3302.74]
+    cbo_makespans = np.array([691.28, 971.98, 1178.67, 1499.52, 2006.63, 2726.39, 3302.74])
 
     # ICBO Makespan
-    icbo_makespans = [690.79, 878.88, 1142.32, 1374.25, 1663.77, 2523.84, 2800.12]
+    icbo_makespans = np.array([690.79, 878.88, 1142.32, 1374.25, 1663.77, 2523.84, 2800.12])
 
     # ICBO-Enhanced Makespan
-    icbo_e_makespans = [596.44, 803.44, 974.33, 1184.50, 1848.58, 1972.39, 3307.50]
+    icbo_e_makespans = np.array([596.44, 803.44, 974.33, 1184.50, 1848.58, 1972.39, 3307.50])
 
     # 计算改进率
-    icbo_improvements = [((cbo - icbo) / cbo) * 100
-                         for cbo, icbo in zip(cbo_makespans, icbo_makespans)]
-    icbo_e_improvements = [((cbo - icbo_e) / cbo) * 100
-                           for cbo, icbo_e in zip(cbo_makespans, icbo_e_makespans)]
+    icbo_improvements = (cbo_makespans - icbo_makespans) / cbo_makespans * 100.0
+    icbo_e_improvements = (cbo_makespans - icbo_e_makespans) / cbo_makespans * 100.0
 
     # 创建图表
     fig, ax = plt.subplots(figsize=(12, 7))
@@ -215,9 +212,9 @@ def plot_icbo_improvement_rate():
     ax.grid(True, alpha=0.3, linestyle='--')
     ax.legend(loc='upper left', fontsize=12, framealpha=0.9)
 
-    plt.tight_layout()
+    plt.subplots_adjust(left=0.065, right=0.925, top=0.91, bottom=0.10)
     output_file = 'results/icbo_improvement_rate.png'
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    plt.savefig(output_file, dpi=300, pil_kwargs={'compress_level': 1})
     print(f"  Saved: {output_file}")
     plt.close()
 
@@ -292,9 +289,9 @@ def plot_heterogeneity_impact():
     ax.text(0.02, 0.98, textstr, transform=ax.transAxes, fontsize=11,
             verticalalignment='top', bbox=props)
 
-    plt.tight_layout()
+    plt.subplots_adjust(left=0.055, right=0.985, top=0.92, bottom=0.085)
     output_file = 'results/heterogeneity_impact.png'
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    plt.savefig(output_file, dpi=300, pil_kwargs={'compress_level': 1})
     print(f"  Saved: {output_file}")
     plt.close()
 
@@ -17,20 +17,61 @@
     - sensitivity_heatmap_cv.png    # 变异系数热力图
 
 依赖：
-    pip install matplotlib pandas numpy seaborn
+    pip install matplotlib pandas numpy
 """
 
 import os
-import glob
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # 仅输出图片文件，不需要GUI后端
 import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
 
 # 配置matplotlib中文显示
 plt.rcParams['font.sans-serif'] = ['SimHei', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
+plt.rcParams['figure.max_open_warning'] = 0
+plt.ioff()
+
+# CSV列类型固定，显式指定以跳过类型推断
+# （指标列必须保持float64：Java端以%.4f输出，float32会改变.2f的舍入结果，如186.2250）
+_DTYPES = {
+    'k': 'int32',
+    'lambda': 'float64',
+    'MeanMakespan': 'float64',
+    'StdMakespan': 'float64',
+    'CV': 'float64',
+    'MinMakespan': 'float64',
+    'MaxMakespan': 'float64',
+}
+
+# 热力图指标（load_data时一次性构建k×λ矩阵）
+_HEATMAP_METRICS = ('MeanMakespan', 'StdMakespan', 'CV')
+
+# plot_all_metrics生成的热力图：(指标, 标题, 文件名)
+_HEATMAP_TASKS = (
+    ('MeanMakespan', 'Parameter Sensitivity: Mean Makespan (Lower is Better)',
+     'sensitivity_heatmap_mean.png'),
+    ('StdMakespan', 'Parameter Sensitivity: Std Makespan (Lower is Better)',
+     'sensitivity_heatmap_std.png'),
+    ('CV', 'Parameter Sensitivity: Coefficient of Variation (Lower is Better)',
+     'sensitivity_heatmap_cv.png'),
+)
+
+# 热力图坐标轴标签（按语言）
+_AXIS_LABELS = {
+    'en': ('k (Dynamic Weight Decay Exponent)', 'λ (Bernoulli Chaotic Parameter)'),
+    'zh': ('k (动态权重衰减指数)', 'λ (Bernoulli混沌参数)'),
+}
+
+
+def _relative_luminance(rgba):
+    """计算RGBA颜色数组的相对亮度（sRGB，WCAG定义）"""
+    rgb = rgba[..., :3]
+    rgb = np.where(rgb <= .03928, rgb / 12.92, ((rgb + .055) / 1.055) ** 2.4)
+    return rgb @ np.array([.2126, .7152, .0722])
 
 
 class SensitivityPlotter:
@@ -48,25 +89,42 @@ class SensitivityPlotter:
         self.output_dir.mkdir(exist_ok=True)
 
         # 自动查找最新的sensitivity_results文件
+        # （单次scandir遍历，每个候选文件只stat一次）
         if data_file is None:
-            files = glob.glob("sensitivity_results_*.csv")
-            if not files:
+            best = None
+            with os.scandir('.') as it:
+                for entry in it:
+                    if entry.name.startswith('sensitivity_results_') and entry.name.endswith('.csv'):
+                        ctime = entry.stat().st_ctime
+                        if best is None or ctime > best[0]:
+                            best = (ctime, entry.name)
+            if best is None:
                 raise FileNotFoundError("未找到sensitivity_results_*.csv文件")
-            data_file = max(files, key=os.path.getctime)
+            data_file = best[1]
             print(f"✓ 自动选择文件: {data_file}")
 
         self.data_file = data_file
         self.data = None
+        self._pivot_all = None
 
     def load_data(self):
-        """加载CSV数据"""
-        self.data = pd.read_csv(self.data_file)
+        """加载CSV数据，并预先计算各指标的k×λ矩阵"""
+        self.data = pd.read_csv(self.data_file, dtype=_DTYPES, engine='c')
+
+        # 一次pivot构建所有指标的k×λ矩阵（列为(指标, k)两级索引），供所有热力图切片复用
+        self._pivot_all = self.data.pivot(
+            index='lambda', columns='k', values=list(_HEATMAP_METRICS)
+        ).sort_index()
+        self._k_vals = np.sort(self.data['k'].unique())
+        self._lambda_vals = np.sort(self.data['lambda'].unique())
+
         print(f"✓ 加载数据: {len(self.data)} 条记录")
-        print(f"  k范围: {self.data['k'].unique()}")
-        print(f"  λ范围: {self.data['lambda'].unique()}")
+        print(f"  k范围: {self._k_vals}")
+        print(f"  λ范围: {self._lambda_vals}")
         return self.data
 
-    def plot_heatmap(self, metric='MeanMakespan', title=None, filename=None):
+    def plot_heatmap(self, metric='MeanMakespan', title=None, filename=None, fig=None,
+                     lang='en', cbar_label=None, mark_default=True):
         """
         绘制参数敏感性热力图
 
@@ -74,44 +132,78 @@ class SensitivityPlotter:
             metric: 要绘制的指标（MeanMakespan/StdMakespan/CV）
             title: 图表标题
             filename: 输出文件名
+            fig: 复用的Figure（为None时新建，并在保存后关闭）
+            lang: 坐标轴标签语言（'en' 或 'zh'）
+            cbar_label: 颜色条标签（为None时使用指标名）
+            mark_default: 是否标记默认配置（k=3, λ=0.4）
         """
         if self.data is None:
             self.load_data()
 
-        # 创建k×λ矩阵
-        pivot_table = self.data.pivot(index='lambda', columns='k', values=metric)
-
-        # 创建图表
-        fig, ax = plt.subplots(figsize=(10, 8))
-
-        # 绘制热力图
-        sns.heatmap(pivot_table,
-                    annot=True,  # 显示数值
-                    fmt='.2f',   # 数值格式
-                    cmap='RdYlGn_r',  # 颜色映射（红色=差，黄色=中，绿色=好）
-                    cbar_kws={'label': metric},
-                    linewidths=0.5,
-                    ax=ax)
+        # 获取k×λ矩阵（预计算之外的指标按需构建）
+        if metric in _HEATMAP_METRICS:
+            pivot_table = self._pivot_all[metric]
+        else:
+            pivot_table = self.data.pivot(index='lambda', columns='k', values=metric).sort_index()
+
+        # 创建图表（传入fig时清空后复用）
+        own_fig = fig is None
+        if own_fig:
+            fig = plt.figure(figsize=(10, 8))
+        else:
+            fig.clear()
+        ax = fig.add_subplot(111)
+
+        # 绘制热力图（pcolormesh + 手动标注，行序与矩阵一致：首行在上）
+        values = pivot_table.to_numpy()
+        n_lambda, n_k = values.shape
+        mesh = ax.pcolormesh(np.arange(n_k + 1), np.arange(n_lambda + 1), values,
+                             cmap='RdYlGn_r',  # 颜色映射（红色=差，黄色=中，绿色=好）
+                             edgecolors='w', linewidth=0.5, rasterized=True)
+        ax.set_xlim(0, n_k)
+        ax.set_ylim(0, n_lambda)
+        ax.invert_yaxis()
+        for spine in ax.spines.values():
+            spine.set_visible(False)
+
+        cbar = fig.colorbar(mesh, ax=ax, label=cbar_label or metric)
+        cbar.outline.set_linewidth(0)
+
+        ax.set_xticks(np.arange(n_k) + 0.5, labels=[str(k) for k in pivot_table.columns])
+        ax.set_yticks(np.arange(n_lambda) + 0.5,
+                      labels=[f'{lam:.1f}' for lam in pivot_table.index],
+                      rotation='vertical', va='center')
+
+        # 显示数值：标签一次性向量化格式化；深色单元格用白字，浅色单元格用深灰字
+        labels = np.char.mod('%.2f', values)
+        text_colors = np.where(_relative_luminance(mesh.to_rgba(values)) > .408, '.15', 'w')
+        for (i, j), label in np.ndenumerate(labels):
+            ax.text(j + 0.5, i + 0.5, label,
+                    ha='center', va='center', color=text_colors[i, j])
 
         # 设置标题和标签
         if title is None:
             title = f'Parameter Sensitivity Analysis - {metric}'
         ax.set_title(title, fontsize=16, fontweight='bold', pad=20)
-        ax.set_xlabel('k (Dynamic Weight Decay Exponent)', fontsize=14, fontweight='bold')
-        ax.set_ylabel('λ (Bernoulli Chaotic Parameter)', fontsize=14, fontweight='bold')
+        xlabel, ylabel = _AXIS_LABELS[lang]
+        ax.set_xlabel(xlabel, fontsize=14, fontweight='bold')
+        ax.set_ylabel(ylabel, fontsize=14, fontweight='bold')
 
         # 标记默认配置（k=3, λ=0.4）
-        self._mark_default_config(ax, pivot_table)
+        if mark_default:
+            self._mark_default_config(ax, pivot_table)
 
         # 保存图片
         if filename is None:
             metric_name = metric.lower().replace('makespan', '')
             filename = f"sensitivity_heatmap_{metric_name}.png"
 
+        # 固定边距代替tight_layout与bbox_inches='tight'，避免保存时的额外渲染
         output_path = self.output_dir / filename
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.subplots_adjust(left=0.065, right=0.985, top=0.925, bottom=0.08)
+        fig.savefig(output_path, dpi=300)
+        if own_fig:
+            plt.close(fig)
 
         print(f"✓ 生成热力图: {output_path}")
 
@@ -145,100 +237,92 @@ class SensitivityPlotter:
         if self.data is None:
             self.load_data()
 
-        # 1. 平均Makespan热力图
-        print("步骤1: 生成平均Makespan热力图...")
-        self.plot_heatmap(
-            metric='MeanMakespan',
-            title='Parameter Sensitivity: Mean Makespan (Lower is Better)',
-            filename='sensitivity_heatmap_mean.png'
-        )
-
-        # 2. 标准差热力图
-        print("\n步骤2: 生成标准差热力图...")
-        self.plot_heatmap(
-            metric='StdMakespan',
-            title='Parameter Sensitivity: Std Makespan (Lower is Better)',
-            filename='sensitivity_heatmap_std.png'
-        )
-
-        # 3. 变异系数热力图
-        print("\n步骤3: 生成变异系数热力图...")
-        self.plot_heatmap(
-            metric='CV',
-            title='Parameter Sensitivity: Coefficient of Variation (Lower is Better)',
-            filename='sensitivity_heatmap_cv.png'
-        )
+        # 三张热力图相互独立，按指标分进程并行渲染（每个进程内复用一个Figure）
+        for i, (metric, _, filename) in enumerate(_HEATMAP_TASKS, start=1):
+            print(f"步骤{i}: 生成{metric}热力图 -> {filename}")
+        print()
+        with ProcessPoolExecutor(max_workers=min(len(_HEATMAP_TASKS), os.cpu_count() or 1),
+                                 initializer=_init_worker,
+                                 initargs=(self.data_file, self.output_dir,
+                                           self.data, self._pivot_all)) as ex:
+            futures = [ex.submit(_plot_heatmap_worker, *task) for task in _HEATMAP_TASKS]
+            for future in futures:
+                future.result()
 
     def generate_analysis_report(self):
         """生成敏感性分析报告"""
         if self.data is None:
             self.load_data()
 
-        report_lines = [
-            "# 参数敏感性分析报告\n",
-            f"生成时间: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
-            f"数据文件: {self.data_file}\n\n",
+        # 各段落先拼接成完整字符串，段落之间以空行分隔，最后一次性写入
+        header = (
+            "# 参数敏感性分析报告\n"
+            f"生成时间: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"数据文件: {self.data_file}\n"
+        )
 
-            "## 1. 参数配置\n",
-            f"- k（动态权重衰减指数）: {sorted(self.data['k'].unique())}\n",
-            f"- λ（Bernoulli混沌参数）: {sorted(self.data['lambda'].unique())}\n",
-            f"- 总配置数: {len(self.data)}\n\n",
+        config = (
+            "## 1. 参数配置\n"
+            f"- k（动态权重衰减指数）: {self._k_vals.tolist()}\n"
+            f"- λ（Bernoulli混沌参数）: {self._lambda_vals.tolist()}\n"
+            f"- 总配置数: {len(self.data)}\n"
+        )
 
-            "## 2. 最佳配置（按平均Makespan排序）\n",
-            "| 排名 | k | λ | Mean Makespan | Std | CV% |\n",
+        # Top 5配置（部分排序即可），表格各行按列向量化拼接
+        top5 = self.data.nsmallest(5, 'MeanMakespan').reset_index(drop=True)
+        top5_rows = ("| " + (top5.index + 1).astype(str)
+                     + " | " + top5['k'].astype(str)
+                     + " | " + top5['lambda'].map('{:.1f}'.format)
+                     + " | " + top5['MeanMakespan'].map('{:.2f}'.format)
+                     + " | " + top5['StdMakespan'].map('{:.2f}'.format)
+                     + " | " + top5['CV'].map('{:.2f}%'.format) + " |")
+        top5_table = (
+            "## 2. 最佳配置（按平均Makespan排序）\n"
+            "| 排名 | k | λ | Mean Makespan | Std | CV% |\n"
             "|------|---|---|---------------|-----|-----|\n"
-        ]
-
-        # 按Mean Makespan排序
-        sorted_data = self.data.sort_values('MeanMakespan')
-
-        # Top 5配置
-        for i, row in sorted_data.head(5).iterrows():
-            report_lines.append(
-                f"| {i+1} | {int(row['k'])} | {row['lambda']:.1f} | "
-                f"{row['MeanMakespan']:.2f} | {row['StdMakespan']:.2f} | "
-                f"{row['CV']:.2f}% |\n"
-            )
+            + "\n".join(top5_rows) + "\n"
+        )
 
         # 默认配置分析
         default_config = self.data[(self.data['k'] == 3) &
                                    (self.data['lambda'].between(0.39, 0.41))]
+        default_block = None
         if not default_config.empty:
             row = default_config.iloc[0]
-            rank = (sorted_data.index == default_config.index[0]).argmax() + 1
-
-            report_lines.extend([
-                "\n## 3. 默认配置 (k=3, λ=0.4) 分析\n",
-                f"- 排名: {rank}/{len(self.data)}\n",
-                f"- Mean Makespan: {row['MeanMakespan']:.2f}\n",
-                f"- Std Makespan: {row['StdMakespan']:.2f}\n",
-                f"- CV: {row['CV']:.2f}%\n",
-                f"- Min: {row['MinMakespan']:.2f}\n",
-                f"- Max: {row['MaxMakespan']:.2f}\n\n"
-            ])
-
-        # 参数影响分析
-        report_lines.extend([
-            "## 4. 参数影响分析\n\n",
-            "### 4.1 k参数影响\n"
-        ])
+            rank = int(self.data['MeanMakespan'].rank(method='min').loc[default_config.index[0]])
+
+            default_block = (
+                "## 3. 默认配置 (k=3, λ=0.4) 分析\n"
+                f"- 排名: {rank}/{len(self.data)}\n"
+                f"- Mean Makespan: {row['MeanMakespan']:.2f}\n"
+                f"- Std Makespan: {row['StdMakespan']:.2f}\n"
+                f"- CV: {row['CV']:.2f}%\n"
+                f"- Min: {row['MinMakespan']:.2f}\n"
+                f"- Max: {row['MaxMakespan']:.2f}\n"
+            )
 
-        for k_val in sorted(self.data['k'].unique()):
-            k_data = self.data[self.data['k'] == k_val]
-            mean_perf = k_data['MeanMakespan'].mean()
-            report_lines.append(f"- k={k_val}: 平均Makespan={mean_perf:.2f}\n")
+        # 参数影响分析（一次groupby计算所有分组均值，groupby结果已按键排序）
+        k_means = self.data.groupby('k')['MeanMakespan'].mean()
+        k_impact = (
+            "## 4. 参数影响分析\n\n"
+            "### 4.1 k参数影响\n"
+            + "".join(f"- k={k_val}: 平均Makespan={mean_perf:.2f}\n"
+                      for k_val, mean_perf in k_means.items())
+        )
 
-        report_lines.append("\n### 4.2 λ参数影响\n")
+        lambda_means = self.data.groupby('lambda')['MeanMakespan'].mean()
+        lambda_impact = (
+            "### 4.2 λ参数影响\n"
+            + "".join(f"- λ={lambda_val:.1f}: 平均Makespan={mean_perf:.2f}\n"
+                      for lambda_val, mean_perf in lambda_means.items())
+        )
 
-        for lambda_val in sorted(self.data['lambda'].unique()):
-            lambda_data = self.data[self.data['lambda'] == lambda_val]
-            mean_perf = lambda_data['MeanMakespan'].mean()
-            report_lines.append(f"- λ={lambda_val:.1f}: 平均Makespan={mean_perf:.2f}\n")
+        sections = [header, config, top5_table, default_block, k_impact, lambda_impact]
 
         # 保存报告
         report_file = self.output_dir / "sensitivity_analysis_report.md"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.writelines(report_lines)
+        report_file.write_text("\n".join(s for s in sections if s is not None),
+                               encoding='utf-8')
 
         print(f"\n✓ 生成分析报告: {report_file}")
 
@@ -249,10 +333,9 @@ class SensitivityPlotter:
 
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
 
-        # 1. k参数趋势
-        for lambda_val in sorted(self.data['lambda'].unique()):
-            lambda_data = self.data[self.data['lambda'] == lambda_val]
-            ax1.plot(lambda_data['k'], lambda_data['MeanMakespan'],
+        # 1. k参数趋势（一次groupby分组，直接传入ndarray）
+        for lambda_val, grp in self.data.sort_values('k', kind='stable').groupby('lambda', sort=True):
+            ax1.plot(grp['k'].to_numpy(), grp['MeanMakespan'].to_numpy(),
                     marker='o', label=f'λ={lambda_val:.1f}')
 
         ax1.set_xlabel('k (Dynamic Weight Decay Exponent)', fontsize=12, fontweight='bold')
@@ -262,9 +345,8 @@ class SensitivityPlotter:
         ax1.grid(True, alpha=0.3)
 
         # 2. λ参数趋势
-        for k_val in sorted(self.data['k'].unique()):
-            k_data = self.data[self.data['k'] == k_val]
-            ax2.plot(k_data['lambda'], k_data['MeanMakespan'],
+        for k_val, grp in self.data.sort_values('lambda', kind='stable').groupby('k', sort=True):
+            ax2.plot(grp['lambda'].to_numpy(), grp['MeanMakespan'].to_numpy(),
                     marker='s', label=f'k={k_val}')
 
         ax2.set_xlabel('λ (Bernoulli Chaotic Parameter)', fontsize=12, fontweight='bold')
@@ -275,13 +357,33 @@ class SensitivityPlotter:
 
         # 保存图片
         output_path = self.output_dir / "sensitivity_trends.png"
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        fig.subplots_adjust(left=0.046, right=0.99, top=0.935, bottom=0.10, wspace=0.10)
+        fig.savefig(output_path, dpi=300)
         plt.close()
 
         print(f"✓ 生成趋势图: {output_path}")
 
 
+# 子进程内的绘图器与Figure（每个进程创建一次，跨任务复用）
+_worker_plotter = None
+_worker_fig = None
+
+
+def _init_worker(data_file, output_dir, data, pivot_all):
+    """子进程初始化：使用主进程已加载的数据创建绘图器，避免重复读取CSV"""
+    global _worker_plotter, _worker_fig
+    _worker_plotter = SensitivityPlotter(data_file, output_dir=output_dir)
+    _worker_plotter.data = data
+    _worker_plotter._pivot_all = pivot_all
+    _worker_fig = plt.figure(figsize=(10, 8))
+
+
+def _plot_heatmap_worker(metric, title, filename):
+    """子进程入口：绘制单个指标的热力图"""
+    _worker_plotter.plot_heatmap(metric=metric, title=title, filename=filename,
+                                 fig=_worker_fig)
+
+
 def main():
     """主函数"""
     print("\n" + "="*70)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""plot_convergence.py 数据加载测试"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from plot_convergence import CACHE_SCHEMA, ConvergencePlotter  # noqa: E402
+
+HEADER = "Iteration,BestFitness\n"
+
+
+def _write_seed(data_dir, algorithm, scale, seed, fitness):
+    """写出一个种子的收敛CSV（格式同ConvergenceRecord.exportToCSV）"""
+    rows = "".join(f"{i},{v:.4f}\n" for i, v in enumerate(fitness))
+    (data_dir / f"convergence_{algorithm}_{scale}_seed{seed}.csv").write_text(HEADER + rows)
+
+
+def _plotter(tmp_path):
+    return ConvergencePlotter(data_dir=tmp_path, output_dir=tmp_path / "results",
+                              cache_dir=tmp_path / "cache")
+
+
+def test_header_only_seed_is_skipped(tmp_path):
+    """只有表头的种子文件不影响同规模其他种子的加载和统计"""
+    _write_seed(tmp_path, "CBO", "M100", 42, [10.0, 8.0, 6.0])
+    _write_seed(tmp_path, "CBO", "M100", 43, [12.0, 10.0, 8.0])
+    (tmp_path / "convergence_CBO_M100_seed44.csv").write_text(HEADER)
+
+    mean, std, data = _plotter(tmp_path).get_statistics("CBO", "M100")
+
+    assert data.seeds.tolist() == [42, 43]
+    assert data.iterations.tolist() == [0, 1, 2]
+    np.testing.assert_allclose(mean, [11.0, 9.0, 7.0])
+    np.testing.assert_allclose(std, [np.sqrt(2)] * 3)
+
+
+def test_cache_with_wrong_layout_is_rebuilt(tmp_path):
+    """旧的（如String列）Parquet缓存即使比CSV新也会被重建"""
+    _write_seed(tmp_path, "CBO", "M100", 42, [10.0, 8.0, 6.0])
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    pl.DataFrame({"Seed": [42], "Iteration": ["0"], "BestFitness": ["1.0"]}).write_parquet(
+        cache_dir / "convergence_CBO_M100.parquet")
+
+    mean, _, _ = _plotter(tmp_path).get_statistics("CBO", "M100")
+
+    assert pl.read_parquet_schema(cache_dir / "convergence_CBO_M100.parquet") == CACHE_SCHEMA
+    np.testing.assert_allclose(mean, [10.0, 8.0, 6.0])
+
+
+def test_algorithm_without_rows_has_no_statistics(tmp_path):
+    """所有种子都只有表头时返回None，不影响同规模的其他算法"""
+    _write_seed(tmp_path, "CBO", "M100", 42, [10.0, 8.0, 6.0])
+    (tmp_path / "convergence_GWO_M100_seed42.csv").write_text(HEADER)
+    (tmp_path / "convergence_GWO_M100_seed43.csv").write_text(HEADER)
+
+    plotter = _plotter(tmp_path)
+    plotter.load_scale(["CBO", "GWO"], "M100")
+
+    assert plotter.get_statistics("GWO", "M100") is None
+    assert plotter.get_statistics("CBO", "M100") is not None
+    assert _plotter(tmp_path).get_statistics("GWO", "M100") is None